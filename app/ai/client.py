@@ -20,4 +20,6 @@ def get_ai_client() -> AIClient:
     provider = os.getenv("AI_PROVIDER", "mock").lower()
     if provider == "mock":
         return MockAIClient()
+    # Real providers pull in heavy SDKs; import them here, not at module level,
+    # so app startup only pays for the provider that is actually configured.
     return MockAIClient()
@@ -22,7 +22,7 @@ def to_recipe_type(recipe: Recipe) -> RecipeType:
 class Query:
     @strawberry.field
     def recipes(self, info) -> list[RecipeType]:
-        session: Session = next(get_session())
+        session: Session = next(get_session(info.context["request"]))
         service = RecipeService(session)
         recipes = service.list_recipes()
         session.close()
@@ -30,7 +30,7 @@ class Query:
 
     @strawberry.field
     def recommend_recipe(self, info) -> RecipeType | None:
-        session: Session = next(get_session())
+        session: Session = next(get_session(info.context["request"]))
         service = RecipeService(session, ai_client=get_ai_client())
         recipe = service.recommend_recipe()
         session.close()
@@ -42,27 +42,31 @@ class Query:
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def create_recipe(self, title: str, description: str | None = None) -> RecipeType:
-        session: Session = next(get_session())
+    def create_recipe(self, info, title: str, description: str | None = None) -> RecipeType:
+        session: Session = next(get_session(info.context["request"]))
         service = RecipeService(session)
         recipe = service.create_recipe(title=title, description=description)
         session.close()
         return to_recipe_type(recipe)
 
     @strawberry.mutation
-    def delete_recipe(self, recipe_id: int) -> bool:
-        session: Session = next(get_session())
+    def delete_recipe(self, info, recipe_id: int) -> bool:
+        session: Session = next(get_session(info.context["request"]))
         service = RecipeService(session)
         deleted = service.delete_recipe(recipe_id)
         session.close()
         return deleted
 
 
-schema = strawberry.Schema(
-    query=Query, 
-    mutation=Mutation,
-    extensions=[
-        QueryDepthLimiter(max_depth=10),
-    ]
-)
-graphql_router = GraphQLRouter(schema)
+def create_schema() -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+        extensions=[
+            QueryDepthLimiter(max_depth=10),
+        ]
+    )
+
+
+def create_graphql_router() -> GraphQLRouter:
+    return GraphQLRouter(create_schema())
@@ -0,0 +1,25 @@
+import os
+from dataclasses import dataclass, field
+
+
+def _split_csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: str = "sqlite:///./app.db"
+    cors_origins: list[str] = field(default_factory=lambda: ["*"])
+    max_request_size: int = 1048576  # 1MB default
+    graphql_enabled: bool = True
+    graphql_rate_limit: int = 100
+    graphql_rate_window: int = 60
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            database_url=os.getenv("DATABASE_URL", cls.database_url),
+            cors_origins=_split_csv(os.getenv("CORS_ORIGINS", "*")),
+            max_request_size=int(os.getenv("MAX_REQUEST_SIZE", cls.max_request_size)),
+            graphql_enabled=os.getenv("GRAPHQL_ENABLED", "true").lower() not in ("0", "false", "no"),
+        )
@@ -1,22 +1,24 @@
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from fastapi import Request
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+class Base(DeclarativeBase):
+    pass
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+def build_engine(database_url: str) -> Engine:
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    return create_engine(database_url, connect_args=connect_args)
 
 
-class Base(DeclarativeBase):
-    pass
+def build_session_factory(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
-def get_session():
-    session = SessionLocal()
+def get_session(request: Request):
+    # Each app instance owns its engine; sessions come from the app serving the request
+    session = request.app.state.session_factory()
     try:
         yield session
     finally:
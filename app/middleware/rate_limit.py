@@ -1,6 +1,7 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-# Shared rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
 
+def create_limiter() -> Limiter:
+    # One limiter per app instance so rate-limit counters are not shared between apps
+    return Limiter(key_func=get_remote_address)
@@ -0,0 +1,70 @@
+"""Cold-start benchmark: module import time and time-to-first-request.
+
+Each sample runs in a fresh interpreter so nothing is already cached in
+sys.modules. Run from the repo root:
+
+    python -m benchmarks.startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Executed in a child interpreter; prints one JSON line of timings in seconds
+_PROBE = """
+import json, os, time
+t0 = time.perf_counter()
+from app.config import Settings
+from app.main import create_app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+settings = Settings(database_url=os.environ["BENCH_DATABASE_URL"], graphql_enabled={graphql})
+t2 = time.perf_counter()
+app = create_app(settings)
+t3 = time.perf_counter()
+with TestClient(app) as client:
+    client.get("/recipes")
+    t4 = time.perf_counter()
+    if settings.graphql_enabled:
+        client.post("/graphql", json={{"query": "{{ recipes {{ id }} }}"}})
+    t5 = time.perf_counter()
+print(json.dumps({{
+    "import": t1 - t0,
+    "create_app": t3 - t2,
+    "first_rest_request": t4 - t3,
+    "first_graphql_request": t5 - t4,
+    "time_to_first_request": (t1 - t0) + (t4 - t2),
+}}))
+"""
+
+
+def run_once(graphql: bool) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(graphql=graphql)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "BENCH_DATABASE_URL": f"sqlite:///{tmp}/bench.db"},
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-graphql", action="store_true", help="benchmark a REST-only app")
+    args = parser.parse_args()
+
+    samples = [run_once(graphql=not args.no_graphql) for _ in range(args.runs)]
+    print(f"{'metric':<24}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for metric in samples[0]:
+        values = [s[metric] * 1000 for s in samples]
+        print(f"{metric:<24}{statistics.median(values):>12.1f}{min(values):>10.1f}{max(values):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from fastapi.testclient import TestClient
+from app.config import Settings
+from app.main import create_app
+
+
+def test_apps_do_not_share_database(tmp_path):
+    # 🤖 Two apps built from different settings get separate engines
+    first = create_app(Settings(database_url=f"sqlite:///{tmp_path / 'first.db'}"))
+    second = create_app(Settings(database_url=f"sqlite:///{tmp_path / 'second.db'}"))
+
+    with TestClient(first) as first_client, TestClient(second) as second_client:
+        first_client.post("/recipes", json={"title": "Only here", "description": None})
+
+        assert len(first_client.get("/recipes").json()) == 1
+        assert second_client.get("/recipes").json() == []
+
+
+def test_graphql_can_be_disabled(tmp_path):
+    # 🤖 REST-only apps skip mounting the GraphQL router entirely
+    settings = Settings(database_url=f"sqlite:///{tmp_path / 'test.db'}", graphql_enabled=False)
+
+    with TestClient(create_app(settings)) as client:
+        assert client.get("/health").json() == {"status": "ok"}
+        assert client.post("/graphql", json={"query": "{ recipes { id } }"}).status_code == 404
+
+
+def test_graphql_rate_limit_is_per_app(tmp_path):
+    # 🤖 A low limit on one app must not leak into a freshly built app
+    settings = Settings(database_url=f"sqlite:///{tmp_path / 'test.db'}", graphql_rate_limit=1)
+    query = {"query": "{ recipes { id } }"}
+
+    with TestClient(create_app(settings)) as client:
+        assert client.post("/graphql", json=query).status_code == 200
+        assert client.post("/graphql", json=query).status_code == 429
+
+    with TestClient(create_app(settings)) as client:
+        assert client.post("/graphql", json=query).status_code == 200